@@ -11,23 +11,42 @@ Usage:
 
 import argparse
 import asyncio
-import json
 import logging
-import queue
+import socket
+import struct
 import threading
 import time
 from typing import Optional
 
 import numpy as np
+import orjson
 import sounddevice as sd
 import websockets
 from loguru import logger
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and unavailable on Windows
+    uvloop = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger.remove()
 logger.add(lambda msg: print(msg, end=""), level="INFO", format="{time:HH:mm:ss} | {level} | {message}")
 
+# Binary frame opcodes, mirroring glados.audio_io.remote_io
+MSG_AUDIO = 0x01  # opcode + float32 PCM samples
+MSG_PLAYBACK = 0x02  # opcode + u32 sample rate + u16 text length + UTF-8 text + float32 PCM samples
+# 0x03 and 0x04 were application-level ping/pong; keepalive now uses WebSocket ping frames
+MSG_STOP = 0x05
+MSG_AUDIO_INT16 = 0x06  # opcode + int16 PCM samples, half the bandwidth of MSG_AUDIO
+
+# Header of a playback frame: opcode, sample rate, text length
+_PLAYBACK_HDR = struct.Struct("<BIH")
+
+MAX_BATCH_CHUNKS = 8  # Maximum number of queued audio chunks coalesced into one frame
+AUDIO_QUEUE_SIZE = 64  # Maximum number of captured chunks waiting to be sent
+
 
 class RemoteAudioClient:
     """Client for streaming audio to a remote GLaDOS server."""
@@ -54,9 +73,11 @@ class RemoteAudioClient:
         self.sample_rate = sample_rate
         self.chunk_size = chunk_size
         self.vad_threshold = vad_threshold
+        self.audio_format = "int16"  # Sample format sent to the server, chosen from its config
         
         self.websocket = None
-        self.audio_queue = queue.Queue()
+        self.audio_queue: asyncio.Queue[np.ndarray] = asyncio.Queue(maxsize=AUDIO_QUEUE_SIZE)
+        self._loop: asyncio.AbstractEventLoop | None = None
         self.is_running = False
         self.is_connected = False
         self.stop_event = threading.Event()
@@ -80,23 +101,31 @@ class RemoteAudioClient:
                 self.server_url,
                 max_size=None,
                 compression=None,
-                ping_interval=30,
+                ping_interval=30,  # Keepalive via RFC 6455 ping/pong frames
                 ping_timeout=10
             )
             
+            # Disable Nagle's algorithm so small frames are sent immediately
+            sock = self.websocket.transport.get_extra_info("socket")
+            if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
             # Wait for configuration from server
             config_message = await self.websocket.recv()
-            config_data = json.loads(config_message)
+            config_data = orjson.loads(config_message)
             
             if config_data.get("type") == "config":
                 self.server_config = config_data
                 self.sample_rate = config_data.get("sample_rate", self.sample_rate)
                 self.chunk_size = config_data.get("chunk_size", self.chunk_size)
+                # Prefer int16 for half the bandwidth; servers that don't list formats take float32
+                formats = config_data.get("formats", ["float32"])
+                self.audio_format = "int16" if "int16" in formats else "float32"
                 
                 logger.info(f"Connected to server. Configuration received:")
                 logger.info(f"  Sample rate: {self.sample_rate} Hz")
                 logger.info(f"  Chunk size: {self.chunk_size} samples")
-                logger.info(f"  Format: {config_data.get('format', 'float32')}")
+                logger.info(f"  Format: {self.audio_format}")
                 
                 self.is_connected = True
                 return True
@@ -122,13 +151,14 @@ class RemoteAudioClient:
                 if status:
                     logger.warning(f"Audio callback status: {status}")
                 
-                # Convert to float32 and add to queue
-                audio_data = np.array(indata).copy().squeeze()
-                self.audio_queue.put(audio_data)
+                # Copy the mono channel out of the PortAudio buffer, which is reused after return
+                audio_data = indata[:, 0].copy()
+                self._loop.call_soon_threadsafe(self._enqueue_audio, audio_data)
             
             self.input_stream = sd.InputStream(
                 samplerate=self.sample_rate,
                 channels=1,
+                dtype=self.audio_format,  # Sent as-is; the server converts int16 to float32
                 callback=audio_callback,
                 blocksize=self.chunk_size,
                 device=self.device
@@ -142,55 +172,41 @@ class RemoteAudioClient:
             logger.error(f"Failed to start audio capture: {e}")
             return False
 
+    def _enqueue_audio(self, audio_data: np.ndarray) -> None:
+        """Queue a captured chunk on the event loop, dropping the oldest one if the queue is full."""
+        if self.audio_queue.full():
+            self.audio_queue.get_nowait()
+        self.audio_queue.put_nowait(audio_data)
+
     async def send_audio_loop(self):
         """Main loop for sending audio data to the server."""
         logger.info("Starting audio streaming...")
+        opcode = MSG_AUDIO_INT16 if self.audio_format == "int16" else MSG_AUDIO
         
-        # Start ping/pong for connection health
-        ping_task = asyncio.create_task(self._ping_pong_loop())
-        
-        try:
-            while self.is_running and self.is_connected:
-                try:
-                    # Get audio data from queue with timeout
-                    try:
-                        audio_data = self.audio_queue.get(timeout=1.0)
-                    except queue.Empty:
-                        continue
-                    
-                    # Send audio data to server
-                    audio_message = {
-                        "type": "audio",
-                        "data": audio_data.tolist()
-                    }
-                    
-                    await self.websocket.send(json.dumps(audio_message))
-                    
-                except websockets.exceptions.ConnectionClosed:
-                    logger.warning("Connection to server closed")
-                    break
-                except Exception as e:
-                    logger.error(f"Error sending audio data: {e}")
-                    break
-                    
-        finally:
-            ping_task.cancel()
-            try:
-                await ping_task
-            except asyncio.CancelledError:
-                pass
-
-    async def _ping_pong_loop(self):
-        """Send periodic ping messages to keep connection alive."""
         while self.is_running and self.is_connected:
             try:
-                await asyncio.sleep(15)  # Ping every 15 seconds
-                if self.is_connected:
-                    await self.websocket.send(json.dumps({"type": "ping"}))
+                # Wait for audio data without blocking the event loop
+                chunks = [await self.audio_queue.get()]
+
+                # Drain whatever else is already queued so a backlog goes out as one frame
+                while len(chunks) < MAX_BATCH_CHUNKS:
+                    try:
+                        chunks.append(self.audio_queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                audio_data = chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+
+                # Send audio data to server as a binary frame
+                await self.websocket.send(
+                    bytes([opcode]) + audio_data.tobytes()
+                )
+
             except websockets.exceptions.ConnectionClosed:
+                logger.warning("Connection to server closed")
                 break
             except Exception as e:
-                logger.error(f"Error in ping/pong loop: {e}")
+                logger.error(f"Error sending audio data: {e}")
                 break
 
     async def receive_messages(self):
@@ -198,21 +214,24 @@ class RemoteAudioClient:
         try:
             async for message in self.websocket:
                 try:
-                    data = json.loads(message)
-                    
-                    if data.get("type") == "pong":
-                        # Server responded to ping
-                        pass
-                    elif data.get("type") == "audio_playback":
-                        # Server wants us to play audio
-                        await self._handle_audio_playback(data)
-                    elif data.get("type") == "stop_playback":
-                        # Server wants us to stop playback
-                        self._stop_audio_playback()
-                    elif data.get("type") == "error":
+                    if isinstance(message, (bytes, bytearray)):
+                        if not message:
+                            continue
+
+                        opcode = message[0]
+                        if opcode == MSG_PLAYBACK:
+                            # Server wants us to play audio
+                            await self._handle_audio_playback(message)
+                        elif opcode == MSG_STOP:
+                            # Server wants us to stop playback
+                            self._stop_audio_playback()
+                        continue
+
+                    data = orjson.loads(message)
+                    if data.get("type") == "error":
                         logger.error(f"Server error: {data.get('message')}")
                         
-                except json.JSONDecodeError as e:
+                except orjson.JSONDecodeError as e:
                     logger.warning(f"Invalid JSON received: {e}")
                 except Exception as e:
                     logger.error(f"Error handling message: {e}")
@@ -222,18 +241,19 @@ class RemoteAudioClient:
         except Exception as e:
             logger.error(f"Error in message receiver: {e}")
 
-    async def _handle_audio_playback(self, data):
+    async def _handle_audio_playback(self, message):
         """Handle audio playback request from server."""
         try:
-            audio_data = np.array(data["data"], dtype=np.float32)
-            sample_rate = data.get("sample_rate", self.sample_rate)
-            text = data.get("text", "")
+            _, sample_rate, text_len = _PLAYBACK_HDR.unpack_from(message, 0)
+            audio_offset = _PLAYBACK_HDR.size + text_len
+            text = message[_PLAYBACK_HDR.size : audio_offset].decode("utf-8", errors="replace")
+            audio_data = np.frombuffer(message, dtype=np.float32, offset=audio_offset)
             
             logger.info(f"Playing audio: {text}")
             
-            # Play audio using sounddevice
+            # Play audio using sounddevice. sd.play returns immediately; waiting for it here
+            # would stall the event loop, and with it audio sending and stop handling.
             sd.play(audio_data, sample_rate)
-            sd.wait()  # Wait for playback to complete
             
         except Exception as e:
             logger.error(f"Error playing audio: {e}")
@@ -265,6 +285,7 @@ class RemoteAudioClient:
     async def run(self):
         """Run the remote audio client."""
         self.is_running = True
+        self._loop = asyncio.get_running_loop()
         
         # Connect to server
         if not await self.connect():
@@ -366,4 +387,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
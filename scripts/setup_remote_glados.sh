@@ -157,7 +157,7 @@ show_usage() {
     echo ""
     echo "2. 🎤 To connect from a remote device:"
     echo "   a. Install dependencies on the client machine:"
-    echo "      pip install sounddevice websockets numpy loguru"
+    echo "      pip install sounddevice websockets numpy loguru orjson"
     echo ""
     echo "   b. Run the client script:"
     echo "      python examples/remote_audio_client.py --server ws://YOUR_SERVER_IP:8765"
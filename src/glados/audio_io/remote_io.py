@@ -1,6 +1,9 @@
 import asyncio
-import json
+import base64
+from collections.abc import Hashable
 import queue
+import socket
+import struct
 import threading
 import time
 from typing import Any, Dict, Optional
@@ -8,9 +11,64 @@ import websockets
 from loguru import logger
 import numpy as np
 from numpy.typing import NDArray
+import orjson
 
 from . import VAD
 
+try:
+    import msgpack  # type: ignore
+except ImportError:  # MessagePack control messages are accepted only when msgpack is installed
+    msgpack = None
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and unavailable on Windows
+    uvloop = None  # type: ignore[assignment]
+
+# Binary frame opcodes. Audio travels as binary WebSocket frames whose first byte
+# selects the message type; JSON text frames are only used for control messages.
+MSG_AUDIO = 0x01  # opcode + float32 PCM samples
+MSG_PLAYBACK = 0x02  # opcode + u32 sample rate + u16 text length + UTF-8 text + float32 PCM samples
+# 0x03 and 0x04 were application-level ping/pong; keepalive now uses WebSocket ping frames
+MSG_STOP = 0x05
+MSG_AUDIO_INT16 = 0x06  # opcode + int16 PCM samples, half the bandwidth of MSG_AUDIO
+MSG_CONTROL = 0x07  # opcode + MessagePack-encoded control message
+
+# Header of a playback frame: opcode, sample rate, text length
+_PLAYBACK_HDR = struct.Struct("<BIH")
+_STOP_FRAME = bytes([MSG_STOP])
+
+
+def _encode_playback(audio_data: NDArray[np.float32], sample_rate: int, text: str) -> bytearray:
+    """Build a playback frame, writing the samples straight into the frame buffer as float32.
+
+    Args:
+        audio_data: Audio samples to play
+        sample_rate: Sample rate of the audio in Hz
+        text: Text spoken in the audio, truncated to 65535 UTF-8 bytes
+
+    Returns:
+        bytearray: Frame laid out as ``_PLAYBACK_HDR``, text, float32 samples
+    """
+    text_bytes = text.encode("utf-8")[:0xFFFF]
+    audio_offset = _PLAYBACK_HDR.size + len(text_bytes)
+    payload = bytearray(audio_offset + audio_data.size * 4)
+    _PLAYBACK_HDR.pack_into(payload, 0, MSG_PLAYBACK, sample_rate, len(text_bytes))
+    payload[_PLAYBACK_HDR.size : audio_offset] = text_bytes
+    np.frombuffer(payload, dtype=np.float32, offset=audio_offset)[:] = audio_data.ravel()
+    return payload
+
+
+def _set_tcp_nodelay(transport: asyncio.BaseTransport) -> None:
+    """Disable Nagle's algorithm so small control frames are not delayed.
+
+    asyncio and uvloop already do this for TCP transports; setting it explicitly
+    keeps the guarantee independent of the event loop implementation.
+    """
+    sock = transport.get_extra_info("socket")
+    if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
 
 class RemoteAudioIO:
     """Audio I/O implementation for remote microphone streaming via WebSocket.
@@ -24,9 +82,13 @@ class RemoteAudioIO:
     SAMPLE_RATE: int = 16000  # Sample rate for input stream
     VAD_SIZE: int = 32  # Milliseconds of sample for Voice Activity Detection (VAD)
     VAD_THRESHOLD: float = 0.8  # Threshold for VAD detection
+    SILENCE_ENERGY: float = 1e-4  # Sum of squared samples per VAD window below which VAD is skipped
     WS_PORT: int = 8765  # WebSocket port for audio streaming
     MAX_CLIENTS: int = 10  # Maximum concurrent clients
     AUDIO_CHUNK_SIZE: int = 1024  # Number of samples per audio chunk
+    SAMPLE_QUEUE_SIZE: int = 320  # Maximum queued VAD windows (~10 s), oldest are dropped beyond this
+    VAD_BATCH_WINDOW: float = 0.005  # Seconds to wait for other clients' audio before running a VAD batch
+    ENABLE_MSGPACK: bool = True  # Accept MessagePack control messages when msgpack is installed
 
     def __init__(self, vad_threshold: float | None = None, ws_port: int | None = None) -> None:
         """Initialize the remote audio I/O system.
@@ -49,12 +111,49 @@ class RemoteAudioIO:
             raise ValueError("VAD threshold must be between 0 and 1")
 
         self._vad_model = VAD()
-        self._sample_queue: queue.Queue[tuple[NDArray[np.float32], bool]] = queue.Queue()
+        self._vad_window_size = self.SAMPLE_RATE * self.VAD_SIZE // 1000
+        self._vad_context_size = self._vad_model.initial_state()[1].shape[-1]
+        # Batched model input, one row per client: that client's context followed by its window
+        self._vad_input = np.zeros(
+            (self.MAX_CLIENTS, self._vad_context_size + self._vad_window_size), dtype=np.float32
+        )
+        self._vad_states: dict[Hashable, tuple[NDArray[np.float32], NDArray[np.float32]]] = {}
+        # Trailing samples of each client's last frame, completed into a VAD window by its next frame
+        self._vad_remainders: dict[Hashable, NDArray[np.float32]] = {}
+        self._vad_queue: (
+            asyncio.Queue[tuple[Hashable, list[NDArray[np.float32]], asyncio.Future[list[bool]]]] | None
+        ) = None
+        self._sample_queue: queue.Queue[tuple[NDArray[np.float32], bool]] = queue.Queue(
+            maxsize=self.SAMPLE_QUEUE_SIZE
+        )
+        self._codecs = ["json"]
+        if self.ENABLE_MSGPACK and msgpack is not None:
+            self._codecs.append("msgpack")
+
+        # Control frames that are identical for every client are encoded once.
+        # The config frame is always JSON; "formats" lists the binary audio sample formats and
+        # "codecs" the control encodings the server accepts.
+        self._config_frame = orjson.dumps({
+            "type": "config",
+            "sample_rate": self.SAMPLE_RATE,
+            "chunk_size": self.AUDIO_CHUNK_SIZE,
+            "formats": ["float32", "int16"],
+            "codecs": self._codecs
+        }).decode()
+        self._capacity_error_frame = orjson.dumps({
+            "type": "error",
+            "message": "Server at maximum capacity"
+        }).decode()
+
         self._is_listening = False
         self._is_playing = False
         self._stop_event = threading.Event()
         self._ws_server = None
         self._ws_thread = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_stop: asyncio.Future[None] | None = None
+        self._playback_timer: asyncio.TimerHandle | None = None
+        self._playback_generation = 0  # Bumped per utterance so a stale timer can't end a newer one
         self._clients: set = set()
         self._client_lock = threading.Lock()
 
@@ -78,53 +177,67 @@ class RemoteAudioIO:
         logger.success("Waiting for remote microphone connections...")
 
     def _run_ws_server(self) -> None:
-        """Run the WebSocket server in a separate thread."""
+        """Run the WebSocket server in a separate thread.
+
+        The thread owns the server event loop (``self._loop``). Code running on other
+        threads must hand coroutines to it with ``asyncio.run_coroutine_threadsafe``.
+        """
         async def handle_client(websocket, path):
             """Handle individual client connections."""
             client_id = f"{websocket.remote_address[0]}:{websocket.remote_address[1]}"
             logger.info(f"Remote client connected: {client_id}")
+            _set_tcp_nodelay(websocket.transport)
             
+            # Decide admission under the lock, but never await while holding it: the lock is
+            # also taken on this loop thread by _broadcast and _close_server.
             with self._client_lock:
-                if len(self._clients) >= self.MAX_CLIENTS:
-                    await websocket.send(json.dumps({
-                        "type": "error",
-                        "message": "Server at maximum capacity"
-                    }))
-                    await websocket.close()
-                    return
-                
-                self._clients.add(websocket)
+                admitted = len(self._clients) < self.MAX_CLIENTS
+                if admitted:
+                    self._clients.add(websocket)
+
+            if not admitted:
+                await websocket.send(self._capacity_error_frame)
+                await websocket.close()
+                return
 
             try:
                 # Send configuration to client
-                await websocket.send(json.dumps({
-                    "type": "config",
-                    "sample_rate": self.SAMPLE_RATE,
-                    "chunk_size": self.AUDIO_CHUNK_SIZE,
-                    "format": "float32"
-                }))
+                await websocket.send(self._config_frame)
 
                 # Handle incoming audio data
                 async for message in websocket:
                     if self._stop_event.is_set():
                         break
-                    
+
                     try:
-                        data = json.loads(message)
+                        if isinstance(message, (bytes, bytearray)):
+                            if not message:
+                                continue
+
+                            opcode = message[0]
+                            if opcode == MSG_AUDIO:
+                                # Zero-copy, read-only view that aliases the received frame
+                                await self._process_audio(websocket, np.frombuffer(message, dtype=np.float32, offset=1))
+
+                            elif opcode == MSG_AUDIO_INT16:
+                                pcm = np.frombuffer(message, dtype=np.int16, offset=1)
+                                await self._process_audio(websocket, np.multiply(pcm, 1 / 32768, dtype=np.float32))
+
+                            if opcode != MSG_CONTROL:
+                                continue
+
+                        # Control messages: JSON text frames, or MessagePack in MSG_CONTROL frames
+                        data = self._decode_control(message)
                         if data.get("type") == "audio":
-                            # Process audio data
-                            audio_data = np.array(data["data"], dtype=np.float32)
-                            if len(audio_data) > 0:
-                                # Apply VAD
-                                vad_value = self._vad_model(np.expand_dims(audio_data, 0))
-                                vad_confidence = vad_value > self.vad_threshold
-                                self._sample_queue.put((audio_data, bool(vad_confidence)))
-                        
-                        elif data.get("type") == "ping":
-                            # Respond to ping for connection health check
-                            await websocket.send(json.dumps({"type": "pong"}))
-
-                    except (json.JSONDecodeError, KeyError, ValueError) as e:
+                            # Raw float32 bytes in MessagePack, base64 for clients limited to JSON text frames
+                            payload = data["data"]
+                            if isinstance(payload, str):
+                                payload = base64.b64decode(payload)
+                            elif not isinstance(payload, bytes):
+                                raise TypeError(f"Audio data must be base64 or bytes, not {type(payload).__name__}")
+                            await self._process_audio(websocket, np.frombuffer(payload, dtype=np.float32))
+
+                    except (KeyError, TypeError, ValueError) as e:
                         logger.warning(f"Error processing message from {client_id}: {e}")
                         continue
 
@@ -135,9 +248,17 @@ class RemoteAudioIO:
             finally:
                 with self._client_lock:
                     self._clients.discard(websocket)
+                self._vad_states.pop(websocket, None)
+                self._vad_remainders.pop(websocket, None)
 
         # Start WebSocket server
         async def server_wrapper():
+            # Resolved by stop_listening, which also sets _stop_event before waking the loop
+            loop_stop: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._loop_stop = loop_stop
+            self._vad_queue = asyncio.Queue()
+            vad_worker = asyncio.create_task(self._vad_worker())
+
             self._ws_server = await websockets.serve(
                 handle_client,
                 "0.0.0.0",
@@ -147,12 +268,214 @@ class RemoteAudioIO:
             )
             logger.info(f"WebSocket server started on ws://0.0.0.0:{self.ws_port}")
             
-            # Keep server running until stop event
-            while not self._stop_event.is_set():
-                await asyncio.sleep(0.1)
+            # Keep server running until stop_listening resolves the stop future
+            if not self._stop_event.is_set():
+                await loop_stop
+
+            vad_worker.cancel()
+            try:
+                await vad_worker
+            except asyncio.CancelledError:
+                pass
+
+        # Run the server on a loop owned by this thread, so other threads can schedule sends on it
+        self._loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(server_wrapper())
+        finally:
+            self._loop.close()
+
+    def _decode_control(self, message: str | bytes | bytearray) -> dict[str, Any]:
+        """Decode a control message from a JSON text frame or a MessagePack binary frame.
+
+        Args:
+            message: Text frame, or binary frame starting with ``MSG_CONTROL``
+
+        Returns:
+            dict[str, Any]: The decoded control message
+
+        Raises:
+            ValueError: If the message cannot be decoded
+            TypeError: If the message is not an object
+        """
+        if isinstance(message, str):
+            data = orjson.loads(message)
+        elif msgpack is not None and "msgpack" in self._codecs:
+            data = msgpack.unpackb(memoryview(message)[1:], raw=False)
+        else:
+            raise ValueError("MessagePack control codec is not enabled")
+
+        if not isinstance(data, dict):
+            raise TypeError("Control message must be an object")
+        return data
+
+    async def _process_audio(self, client: Hashable, audio_data: NDArray[np.float32]) -> None:
+        """Run VAD on audio received from a client and put it in the sample queue.
+
+        Frames may carry any number of samples, so the audio is split into VAD-sized
+        windows, which are views into the received frame. A trailing partial window
+        is kept per client and prepended to that client's next frame, so no padding
+        is spliced into the stream. Windows whose energy is below ``SILENCE_ENERGY``
+        are marked as silent without running the VAD model and reset the client's
+        VAD state; the others are handed to the VAD worker and batched with other
+        clients.
+
+        The windows put in the sample queue may be read-only views aliasing the
+        received frame buffer; consumers must copy a sample before modifying it.
+        The VAD model only sees them through a copy into ``_vad_input``.
+
+        Args:
+            client: Connection the audio was received from, used to track its VAD state
+            audio_data: Mono float32 samples received from a remote client
+        """
+        if len(audio_data) == 0:
+            return
+
+        remainder = self._vad_remainders.pop(client, None)
+        if remainder is not None:
+            audio_data = np.concatenate([remainder, audio_data])
+
+        window = self._vad_window_size
+        full = len(audio_data) - len(audio_data) % window
+        if full < len(audio_data):
+            self._vad_remainders[client] = audio_data[full:].copy()
+        samples = [audio_data[start : start + window] for start in range(0, full, window)]
+
+        # Windows that are obviously silent cannot contain speech, skip the model. The model never
+        # sees them, so the client's recurrent state is reset instead of carrying stale context
+        # across the silence into the next voiced window.
+        start = 0
+        for end, sample in enumerate(samples):
+            if sample @ sample >= self.SILENCE_ENERGY:
+                continue
+            await self._put_voiced(client, samples[start:end])
+            self._vad_states.pop(client, None)
+            self._put_sample(sample, False)
+            start = end + 1
+        await self._put_voiced(client, samples[start:])
+
+    async def _put_voiced(self, client: Hashable, samples: list[NDArray[np.float32]]) -> None:
+        """Run VAD on consecutive windows from a client and put them in the sample queue.
+
+        Args:
+            client: Connection the audio was received from
+            samples: Consecutive VAD windows from that client, all above the silence gate
+        """
+        for sample, confidence in zip(samples, await self._detect_voice(client, samples), strict=True):
+            self._put_sample(sample, confidence)
+
+    async def _detect_voice(self, client: Hashable, samples: list[NDArray[np.float32]]) -> list[bool]:
+        """Queue a client's VAD windows for the VAD worker and wait for the results.
+
+        Args:
+            client: Connection the audio was received from
+            samples: Consecutive VAD windows from that client
+
+        Returns:
+            list[bool]: Whether voice activity was detected, per window
+        """
+        if not samples or self._vad_queue is None:
+            return [False] * len(samples)
+
+        future: asyncio.Future[list[bool]] = asyncio.get_running_loop().create_future()
+        await self._vad_queue.put((client, samples, future))
+        return await future
+
+    async def _vad_worker(self) -> None:
+        """Batch queued VAD requests from concurrent clients into single model runs."""
+        assert self._vad_queue is not None
+        loop = asyncio.get_running_loop()
+
+        requests: list[tuple[Hashable, list[NDArray[np.float32]], asyncio.Future[list[bool]]]] = []
+        try:
+            while True:
+                requests = [await self._vad_queue.get()]
+
+                # Give the other connected clients a short window to join the batch
+                deadline = loop.time() + self.VAD_BATCH_WINDOW
+                while len(requests) < min(len(self._clients), self.MAX_CLIENTS):
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        requests.append(await asyncio.wait_for(self._vad_queue.get(), timeout))
+                    except TimeoutError:
+                        break
+
+                try:
+                    results = self._run_vad_batch([(client, samples) for client, samples, _ in requests])
+                except Exception as e:
+                    for _, _, future in requests:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+
+                for (_, _, future), result in zip(requests, results, strict=True):
+                    if not future.done():
+                        future.set_result(result)
+                requests = []
+        finally:
+            # Cancel requests still in flight or queued so no handler waits on them forever
+            while not self._vad_queue.empty():
+                requests.append(self._vad_queue.get_nowait())
+            for _, _, future in requests:
+                future.cancel()
+
+    def _run_vad_batch(self, requests: list[tuple[Hashable, list[NDArray[np.float32]]]]) -> list[list[bool]]:
+        """Run the VAD model over windows from several clients, one row per client.
+
+        The model is recurrent, so each client keeps its own state and its windows
+        are processed in order, one step per batch.
+
+        Args:
+            requests: Pairs of (client, consecutive VAD windows)
+
+        Returns:
+            list[list[bool]]: Voice activity per window, for each request
+        """
+        results: list[list[bool]] = [[] for _ in requests]
 
-        # Run the server
-        asyncio.run(server_wrapper())
+        for step in range(max(len(samples) for _, samples in requests)):
+            rows = [i for i, (_, samples) in enumerate(requests) if step < len(samples)]
+            clients = [requests[i][0] for i in rows]
+            states = [self._vad_states.get(client) or self._vad_model.initial_state() for client in clients]
+
+            # Assemble context and window rows in the preallocated input so the model reads it without copies
+            model_input = self._vad_input[: len(rows)]
+            for row, (i, (_, context)) in enumerate(zip(rows, states, strict=True)):
+                model_input[row, : self._vad_context_size] = context[0]
+                model_input[row, self._vad_context_size :] = requests[i][1][step]
+
+            out, state = self._vad_model.forward_input(
+                model_input, np.concatenate([s for s, _ in states], axis=1)
+            )
+
+            confidences = out.reshape(len(rows)) > self.vad_threshold
+            for row, (i, client, (_, context)) in enumerate(zip(rows, clients, states, strict=True)):
+                # Each client owns its context array, updated in place from the input row
+                context[0] = model_input[row, -self._vad_context_size :]
+                self._vad_states[client] = (state[:, row : row + 1], context)
+                results[i].append(bool(confidences[row]))
+
+        return results
+
+    def _put_sample(self, sample: NDArray[np.float32], vad_confidence: bool) -> None:
+        """Put a sample in the queue, dropping the oldest one if the consumer has fallen behind.
+
+        Args:
+            sample: VAD window of mono float32 samples
+            vad_confidence: Whether voice activity was detected in the window
+        """
+        while True:
+            try:
+                self._sample_queue.put_nowait((sample, vad_confidence))
+                return
+            except queue.Full:
+                try:
+                    self._sample_queue.get_nowait()
+                except queue.Empty:
+                    pass
 
     def stop_listening(self) -> None:
         """Stop the WebSocket server and clean up resources."""
@@ -160,20 +483,21 @@ class RemoteAudioIO:
             return
 
         self._is_listening = False
-        self._stop_event.set()
 
-        # Close all client connections
-        with self._client_lock:
-            for client in self._clients.copy():
-                try:
-                    asyncio.create_task(client.close())
-                except:
-                    pass
-            self._clients.clear()
+        # Close client connections and the server on the server loop, before it is stopped
+        if self._loop is not None and self._loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(self._close_server(), self._loop)
+            try:
+                future.result(timeout=2)
+            except TimeoutError:
+                future.cancel()
+                logger.warning("Timed out closing remote audio connections")
+            except Exception as e:
+                logger.error(f"Error closing remote audio server: {e}")
 
-        # Stop WebSocket server
-        if self._ws_server:
-            asyncio.create_task(self._ws_server.close())
+        self._stop_event.set()
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._resolve_loop_stop)
 
         # Wait for WebSocket thread to finish
         if self._ws_thread and self._ws_thread.is_alive():
@@ -181,6 +505,23 @@ class RemoteAudioIO:
 
         logger.info("Remote audio server stopped")
 
+    def _resolve_loop_stop(self) -> None:
+        """Wake the server loop so it shuts down. Runs on the server loop."""
+        if self._loop_stop is not None and not self._loop_stop.done():
+            self._loop_stop.set_result(None)
+
+    async def _close_server(self) -> None:
+        """Close all client connections and the WebSocket server. Runs on the server loop."""
+        with self._client_lock:
+            clients = list(self._clients)
+            self._clients.clear()
+
+        await asyncio.gather(*(client.close() for client in clients), return_exceptions=True)
+
+        if self._ws_server is not None:
+            self._ws_server.close()
+            await self._ws_server.wait_closed()
+
     def start_speaking(self, audio_data: NDArray[np.float32], sample_rate: int | None = None, text: str = "") -> None:
         """Play audio through remote clients.
 
@@ -195,10 +536,17 @@ class RemoteAudioIO:
         if sample_rate is None:
             sample_rate = self.SAMPLE_RATE
 
+        loop = self._loop
+        if loop is None:
+            logger.warning("Remote audio server is not running, cannot play audio")
+            return
+
         # Stop any existing playback
         self.stop_speaking()
 
         logger.debug(f"Broadcasting audio to {len(self._clients)} remote clients")
+        self._playback_generation += 1
+        generation = self._playback_generation
         self._is_playing = True
 
         # Send audio data to all connected clients
@@ -208,35 +556,57 @@ class RemoteAudioIO:
                 self._is_playing = False
                 return
 
-            # Convert audio to list for JSON serialization
-            audio_list = audio_data.tolist()
-            
-            # Create audio message
-            audio_message = {
-                "type": "audio_playback",
-                "data": audio_list,
-                "sample_rate": sample_rate,
-                "text": text
-            }
+            # Build the binary playback frame once for all clients
+            payload = _encode_playback(audio_data, sample_rate, text)
 
             # Broadcast to all clients
-            disconnected_clients = set()
-            for client in self._clients:
-                try:
-                    asyncio.create_task(client.send(json.dumps(audio_message)))
-                except:
-                    disconnected_clients.add(client)
+            asyncio.run_coroutine_threadsafe(self._broadcast(payload), loop)
+
+            # Simulate playback duration with a timer on the server loop
+            playback_duration = len(audio_data) / sample_rate
+            loop.call_soon_threadsafe(self._start_playback_timer, playback_duration, generation)
+
+    async def _broadcast(self, payload: bytes | bytearray) -> None:
+        """Send one pre-encoded frame to every connected client.
+
+        Runs on the server event loop. Clients whose send fails are dropped.
+
+        Args:
+            payload: Encoded frame shared by all clients
+        """
+        with self._client_lock:
+            clients = list(self._clients)
+
+        results = await asyncio.gather(*(client.send(payload) for client in clients), return_exceptions=True)
 
-            # Remove disconnected clients
-            for client in disconnected_clients:
-                self._clients.discard(client)
+        with self._client_lock:
+            for client, result in zip(clients, results, strict=True):
+                if isinstance(result, Exception):
+                    logger.warning(f"Dropping remote client after failed send: {result}")
+                    self._clients.discard(client)
 
-        # Simulate playback duration
-        playback_duration = len(audio_data) / sample_rate
-        threading.Timer(playback_duration, self._on_playback_complete).start()
+    def _start_playback_timer(self, duration: float, generation: int) -> None:
+        """Mark playback ``generation`` complete after ``duration`` seconds. Runs on the server loop."""
+        self._cancel_playback_timer()
+        self._playback_timer = asyncio.get_running_loop().call_later(
+            duration, self._on_playback_complete, generation
+        )
 
-    def _on_playback_complete(self) -> None:
-        """Called when audio playback is complete."""
+    def _cancel_playback_timer(self) -> None:
+        """Cancel the pending playback timer, if any. Runs on the server loop."""
+        if self._playback_timer is not None:
+            self._playback_timer.cancel()
+            self._playback_timer = None
+
+    def _on_playback_complete(self, generation: int) -> None:
+        """Called when audio playback is complete.
+
+        A timer from an earlier utterance can fire after ``start_speaking`` has begun
+        the next one but before its timer replaced the old one; it is ignored then.
+        """
+        if generation != self._playback_generation:
+            return
+        self._playback_timer = None
         self._is_playing = False
 
     def measure_percentage_spoken(self, total_samples: int, sample_rate: int | None = None) -> tuple[bool, int]:
@@ -271,21 +641,16 @@ class RemoteAudioIO:
         """Stop audio playback to remote clients."""
         if self._is_playing:
             self._is_playing = False
-            
+
+            loop = self._loop
+            if loop is None:
+                return
+
             # Send stop signal to all clients
             with self._client_lock:
-                stop_message = {"type": "stop_playback"}
-                disconnected_clients = set()
-                
-                for client in self._clients:
-                    try:
-                        asyncio.create_task(client.send(json.dumps(stop_message)))
-                    except:
-                        disconnected_clients.add(client)
-                
-                # Remove disconnected clients
-                for client in disconnected_clients:
-                    self._clients.discard(client)
+                if self._clients:
+                    loop.call_soon_threadsafe(self._cancel_playback_timer)
+                    asyncio.run_coroutine_threadsafe(self._broadcast(_STOP_FRAME), loop)
 
     def get_sample_queue(self) -> queue.Queue[tuple[NDArray[np.float32], bool]]:
         """Get the queue containing audio samples and VAD confidence.
@@ -77,7 +77,7 @@ class SoundDeviceAudioIO:
                 status: Status flags for the audio callback
 
             Notes:
-                - Copies and squeezes the input data to ensure single-channel processing
+                - Copies the first channel out of the input buffer to ensure single-channel processing
                 - Applies voice activity detection to determine speech presence
                 - Puts processed audio samples and VAD confidence into a thread-safe queue
             """
@@ -85,7 +85,7 @@ class SoundDeviceAudioIO:
                 # Log any errors for debugging
                 logger.debug(f"Audio callback status: {status}")
 
-            data = np.array(indata).copy().squeeze()  # Reduce to single channel if necessary
+            data = indata[:, 0].copy()  # Single copy of the mono channel; PortAudio reuses indata
             vad_value = self._vad_model(np.expand_dims(data, 0))
             vad_confidence = vad_value > self.vad_threshold
             self._sample_queue.put((data, bool(vad_confidence)))
@@ -38,6 +38,7 @@ class VAD:
         )
 
         self.avaliable_sample_rates = [8000, 16000]
+        self._sample_rate_inputs = {sr: np.array(sr, dtype=np.int64) for sr in self.avaliable_sample_rates}
 
         self._state: NDArray[np.float32]
         self._context: NDArray[np.float32]
@@ -86,28 +87,100 @@ class VAD:
         if not len(self._context):
             self._context = np.zeros((batch_size, context_size), dtype=np.float32)
 
-        audio_sample = np.concatenate([self._context, audio_sample], axis=1)
-
-        if sample_rate in [8000, 16000]:
-            ort_inputs = {
-                "input": audio_sample.astype(np.float32),
-                "state": self._state,
-                "sr": np.array(sample_rate, dtype=np.int64),
-            }
-            ort_outs = self.ort_sess.run(None, ort_inputs)
-            out: NDArray[np.float32]
-            state: NDArray[np.float32]
-            out, state = ort_outs
-            self._state = state
-        else:
-            raise ValueError()
-
-        self._context = audio_sample[..., -context_size:]
+        out, self._state, self._context = self.forward(audio_sample, self._state, self._context, sample_rate)
         self._last_sr = sample_rate
         self._last_batch_size = batch_size
 
         return np.squeeze(out)
 
+    def initial_state(
+        self, batch_size: int = 1, sample_rate: int = SAMPLE_RATE
+    ) -> tuple[NDArray[np.float32], NDArray[np.float32]]:
+        """Create zeroed recurrent state and context for use with `forward`.
+
+        Args:
+            batch_size (int): Number of independent audio streams.
+            sample_rate (int): Sample rate of the audio samples.
+
+        Returns:
+            tuple[NDArray[np.float32], NDArray[np.float32]]: State with shape (2, batch_size, 128)
+                and context with shape (batch_size, context_size).
+        """
+        context_size = 64 if sample_rate == 16000 else 32
+        return (
+            np.zeros((2, batch_size, 128), dtype=np.float32),
+            np.zeros((batch_size, context_size), dtype=np.float32),
+        )
+
+    def forward(
+        self,
+        audio_sample: NDArray[np.float32],
+        state: NDArray[np.float32],
+        context: NDArray[np.float32],
+        sample_rate: int = SAMPLE_RATE,
+    ) -> tuple[NDArray[np.float32], NDArray[np.float32], NDArray[np.float32]]:
+        """Run the model on a batch using caller-provided recurrent state.
+
+        Unlike `__call__`, no state is kept on the instance, so rows of a batch can
+        belong to independent audio streams whose state is tracked by the caller.
+
+        Args:
+            audio_sample (NDArray[np.float32]): Audio samples with shape (batch_size, num_samples).
+            state (NDArray[np.float32]): Recurrent state with shape (2, batch_size, 128).
+            context (NDArray[np.float32]): Trailing samples of the previous window per row.
+            sample_rate (int): Sample rate of the audio samples.
+
+        Returns:
+            tuple[NDArray[np.float32], NDArray[np.float32], NDArray[np.float32]]: VAD output with
+                shape (batch_size, 1), and the updated state and context.
+
+        Raises:
+            ValueError: If the sample rate is not supported.
+        """
+        model_input = np.concatenate([context, audio_sample], axis=1)
+        out, state = self.forward_input(model_input, state, sample_rate)
+
+        return out, state, model_input[..., -context.shape[-1] :]
+
+    def forward_input(
+        self,
+        model_input: NDArray[np.float32],
+        state: NDArray[np.float32],
+        sample_rate: int = SAMPLE_RATE,
+    ) -> tuple[NDArray[np.float32], NDArray[np.float32]]:
+        """Run the model on input that already starts with each row's context.
+
+        This is the allocation-free core of `forward`: a contiguous float32 input
+        is passed to the model as is, so callers can reuse one buffer across calls.
+        The next context is the trailing context_size samples of each input row.
+
+        Args:
+            model_input (NDArray[np.float32]): Context followed by audio samples, with shape
+                (batch_size, context_size + num_samples).
+            state (NDArray[np.float32]): Recurrent state with shape (2, batch_size, 128).
+            sample_rate (int): Sample rate of the audio samples.
+
+        Returns:
+            tuple[NDArray[np.float32], NDArray[np.float32]]: VAD output with shape
+                (batch_size, 1) and the updated state.
+
+        Raises:
+            ValueError: If the sample rate is not supported.
+        """
+        if sample_rate not in self.avaliable_sample_rates:
+            raise ValueError(f"Unsupported sample rate {sample_rate} (Supported values: 8000, 16000)")
+
+        ort_inputs = {
+            "input": model_input.astype(np.float32, copy=False),
+            "state": state,
+            "sr": self._sample_rate_inputs[sample_rate],
+        }
+        ort_outs = self.ort_sess.run(None, ort_inputs)
+        out: NDArray[np.float32]
+        out, state = ort_outs
+
+        return out, state
+
     def audio_forward(self, x: NDArray[np.float32], sample_rate: int = SAMPLE_RATE) -> NDArray[np.float32]:
         """Process an audio signal and return the VAD output.
 
@@ -0,0 +1,124 @@
+"""
+Unit tests for the RemoteAudioIO class.
+
+These exercise the parts of the remote audio backend that don't need a network
+connection: window splitting, the silence gate, playback frame encoding, the
+bounded sample queue, control message decoding and VAD batching across clients.
+"""
+
+import asyncio
+from collections.abc import Generator
+
+import numpy as np
+import orjson
+import pytest
+
+from glados.audio_io.remote_io import _PLAYBACK_HDR, MSG_CONTROL, MSG_PLAYBACK, RemoteAudioIO, _encode_playback
+
+
+@pytest.fixture
+def remote() -> Generator[RemoteAudioIO, None, None]:
+    """Provide a RemoteAudioIO instance that is not listening."""
+    yield RemoteAudioIO()
+
+
+def _drain(remote: RemoteAudioIO) -> list[tuple[np.ndarray, bool]]:
+    queue = remote.get_sample_queue()
+    return [queue.get_nowait() for _ in range(queue.qsize())]
+
+
+def test_process_audio_carries_partial_windows_to_next_frame(remote: RemoteAudioIO) -> None:
+    client = object()
+    window = remote._vad_window_size
+    audio = np.linspace(0.1, 0.9, window * 3, dtype=np.float32)
+
+    # Four frames of 3/4 window each add up to exactly three windows
+    for frame in np.split(audio, 4):
+        asyncio.run(remote._process_audio(client, frame))
+
+    samples = _drain(remote)
+    assert [len(sample) for sample, _ in samples] == [window] * 3
+    np.testing.assert_array_equal(np.concatenate([sample for sample, _ in samples]), audio)
+    assert client not in remote._vad_remainders
+
+
+def test_process_audio_gates_silence_and_resets_vad_state(remote: RemoteAudioIO) -> None:
+    client = object()
+    remote._vad_states[client] = remote._vad_model.initial_state()
+
+    asyncio.run(remote._process_audio(client, np.zeros(remote._vad_window_size, dtype=np.float32)))
+
+    assert [confidence for _, confidence in _drain(remote)] == [False]
+    assert client not in remote._vad_states
+
+
+@pytest.mark.parametrize("text", ["", "Hello from GLaDOS", "Ünïcödé ✓"])
+def test_encode_playback_round_trip(text: str) -> None:
+    audio = np.linspace(-1, 1, 1000, dtype=np.float64)
+
+    frame = _encode_playback(audio, 22050, text)
+
+    opcode, sample_rate, text_len = _PLAYBACK_HDR.unpack_from(frame, 0)
+    audio_offset = _PLAYBACK_HDR.size + text_len
+    assert (opcode, sample_rate) == (MSG_PLAYBACK, 22050)
+    assert frame[_PLAYBACK_HDR.size : audio_offset].decode("utf-8") == text
+    np.testing.assert_array_equal(
+        np.frombuffer(frame, dtype=np.float32, offset=audio_offset), audio.astype(np.float32)
+    )
+
+
+def test_put_sample_drops_oldest(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(RemoteAudioIO, "SAMPLE_QUEUE_SIZE", 3)
+    remote = RemoteAudioIO()
+
+    for i in range(5):
+        remote._put_sample(np.full(4, i, dtype=np.float32), bool(i % 2))
+
+    assert [int(sample[0]) for sample, _ in _drain(remote)] == [2, 3, 4]
+
+
+def test_decode_control_json(remote: RemoteAudioIO) -> None:
+    message = orjson.dumps({"type": "audio", "data": "AAAAAA=="}).decode()
+    assert remote._decode_control(message) == {"type": "audio", "data": "AAAAAA=="}
+
+
+def test_decode_control_rejects_invalid_json(remote: RemoteAudioIO) -> None:
+    with pytest.raises(ValueError):
+        remote._decode_control("not json")
+
+
+def test_decode_control_rejects_non_object(remote: RemoteAudioIO) -> None:
+    with pytest.raises(TypeError):
+        remote._decode_control("[1, 2, 3]")
+
+
+def test_decode_control_msgpack(remote: RemoteAudioIO) -> None:
+    msgpack = pytest.importorskip("msgpack")
+    frame = bytes([MSG_CONTROL]) + msgpack.packb({"type": "audio", "data": b"\x00\x00\x00\x00"}, use_bin_type=True)
+
+    assert remote._decode_control(frame) == {"type": "audio", "data": b"\x00\x00\x00\x00"}
+
+
+def test_run_vad_batch_matches_per_client_vad(remote: RemoteAudioIO) -> None:
+    rng = np.random.default_rng(0)
+    window = remote._vad_window_size
+    clients = [object(), object()]
+    requests = [
+        (clients[0], [rng.uniform(-0.5, 0.5, window).astype(np.float32) for _ in range(3)]),
+        (clients[1], [rng.uniform(-0.5, 0.5, window).astype(np.float32) for _ in range(2)]),
+    ]
+
+    results = remote._run_vad_batch(requests)
+
+    vad = remote._vad_model
+    for (client, samples), result in zip(requests, results, strict=True):
+        state, context = vad.initial_state()
+        expected = []
+        for sample in samples:
+            out, state, context = vad.forward(sample[np.newaxis], state, context)
+            expected.append(bool(out[0, 0] > remote.vad_threshold))
+        assert result == expected
+
+        stored_state, stored_context = remote._vad_states[client]
+        np.testing.assert_allclose(stored_state, state, rtol=1e-4, atol=1e-5)
+        np.testing.assert_array_equal(stored_context, context)
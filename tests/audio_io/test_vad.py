@@ -0,0 +1,95 @@
+"""
+Unit tests for the VAD class.
+
+Checks that the stateful `__call__` behaves as the original single-stream
+implementation, and that the stateless `forward`/`forward_input` API gives the
+same results when independent streams are batched together.
+"""
+
+from collections.abc import Generator
+
+import numpy as np
+from numpy.typing import NDArray
+import pytest
+
+from glados.audio_io import VAD
+
+WINDOW = 512
+CONTEXT = 64
+
+
+@pytest.fixture(scope="module")
+def vad() -> Generator[VAD, None, None]:
+    """Provide a VAD instance shared by the tests in this module."""
+    yield VAD()
+
+
+def _windows(seed: int, count: int) -> list[NDArray[np.float32]]:
+    rng = np.random.default_rng(seed)
+    return [rng.uniform(-0.5, 0.5, (1, WINDOW)).astype(np.float32) for _ in range(count)]
+
+
+def _reference_call(vad: VAD, windows: list[NDArray[np.float32]]) -> list[NDArray[np.float32]]:
+    """Single-stream VAD as implemented before the stateless API was added."""
+    state = np.zeros((2, 1, 128), dtype=np.float32)
+    context = np.zeros((1, CONTEXT), dtype=np.float32)
+    outs = []
+    for window in windows:
+        audio = np.concatenate([context, window], axis=1)
+        out, state = vad.ort_sess.run(
+            None, {"input": audio.astype(np.float32), "state": state, "sr": np.array(16000, dtype=np.int64)}
+        )
+        context = audio[..., -CONTEXT:]
+        outs.append(np.squeeze(out))
+    return outs
+
+
+def test_call_matches_reference(vad: VAD) -> None:
+    windows = _windows(0, 8)
+    expected = _reference_call(vad, windows)
+
+    vad.reset_states()
+    for window, reference in zip(windows, expected, strict=True):
+        np.testing.assert_allclose(vad(window), reference, rtol=1e-5, atol=1e-6)
+
+
+def test_forward_input_matches_forward(vad: VAD) -> None:
+    window = _windows(1, 1)[0]
+    state, context = vad.initial_state()
+
+    out, new_state, new_context = vad.forward(window, state, context)
+    out_input, state_input = vad.forward_input(np.concatenate([context, window], axis=1), state)
+
+    np.testing.assert_allclose(out_input, out, rtol=1e-5, atol=1e-6)
+    np.testing.assert_allclose(state_input, new_state, rtol=1e-5, atol=1e-6)
+    np.testing.assert_array_equal(new_context, window[:, -CONTEXT:])
+
+
+def test_batched_forward_matches_sequential_streams(vad: VAD) -> None:
+    streams = [_windows(seed, 6) for seed in (2, 3, 4)]
+
+    sequential = []
+    for windows in streams:
+        state, context = vad.initial_state()
+        outs = []
+        for window in windows:
+            out, state, context = vad.forward(window, state, context)
+            outs.append(out[0, 0])
+        sequential.append(outs)
+
+    states = [vad.initial_state() for _ in streams]
+    for step in range(6):
+        out, state, context = vad.forward(
+            np.concatenate([windows[step] for windows in streams], axis=0),
+            np.concatenate([s for s, _ in states], axis=1),
+            np.concatenate([c for _, c in states], axis=0),
+        )
+        states = [(state[:, row : row + 1], context[row : row + 1]) for row in range(len(streams))]
+        for row, outs in enumerate(sequential):
+            assert out[row, 0] == pytest.approx(outs[step], rel=1e-4, abs=1e-5)
+
+
+def test_forward_rejects_unsupported_sample_rate(vad: VAD) -> None:
+    state, context = vad.initial_state()
+    with pytest.raises(ValueError):
+        vad.forward(_windows(5, 1)[0], state, context, sample_rate=44100)